@@ -1,4 +1,6 @@
 WIDTH = 1280
 HEIGHT = 720
+FPS = 60
+LOW_LATENCY = True
 
 BACKGROUND = "assets/sprites/background.png"
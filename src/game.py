@@ -1,4 +1,7 @@
+import sys
+
 import pygame
+from pygame.locals import K_ESCAPE, KEYDOWN, QUIT, WINDOWEXPOSED
 
 import src.config as config
 from src.windows import Background
@@ -9,11 +12,44 @@ class Game:
         """Initialization of the game class"""
         pygame.init()
         pygame.display.set_caption("Flappy Bird")
-        self.screen = pygame.display.set_mode((config.WIDTH, config.HEIGHT))
+        self.screen = pygame.display.set_mode(
+            (config.WIDTH, config.HEIGHT), pygame.DOUBLEBUF, vsync=0
+        )
         self.background = Background()
+        self.clock = pygame.time.Clock()
+        # Only queue the events the loop handles; SDL drops the rest
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([QUIT, KEYDOWN, WINDOWEXPOSED])
+
+    def check_quit_event(self, event: pygame.event.Event) -> None:
+        """Close the game on window close or escape key"""
+        event_type = event.type
+        if event_type == QUIT or (event_type == KEYDOWN and event.key == K_ESCAPE):
+            pygame.quit()
+            sys.exit()
 
-    def start(self):
+    def start(self) -> None:
         """Function that start the game"""
+        event_get = pygame.event.get
+        check_quit_event = self.check_quit_event
+        flip = pygame.display.flip
+        screen = self.screen
+        background = self.background
+        # tick_busy_loop avoids coarse SDL_Delay for steadier frame pacing
+        tick = self.clock.tick_busy_loop if config.LOW_LATENCY else self.clock.tick
+        fps = config.FPS
+        full_redraw = True
 
         while True:
-            self.background.draw(self.screen)
+            # Non-blocking drain: the loop is driven by frames, not by input
+            for event in event_get():
+                check_quit_event(event)
+                if event.type == WINDOWEXPOSED:
+                    full_redraw = True
+
+            # Nothing moves yet: repaint only on the first frame and when uncovered
+            if full_redraw:
+                background.draw(screen)
+                flip()
+                full_redraw = False
+            tick(fps)
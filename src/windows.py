@@ -1,18 +1,24 @@
+from functools import cache
+
 import pygame
 
 import src.config as config
 
 
+@cache
+def _load_bg() -> pygame.Surface:
+    """Load and convert the background image once, shared by every Background"""
+    return pygame.image.load(config.BACKGROUND).convert()
+
+
 class Background:
+    __slots__ = ("image", "_dest")
+
     def __init__(self) -> None:
         """Initialization of the background class"""
-        self.image = pygame.image.load(config.BACKGROUND).convert()
-
-    @property
-    def rect(self) -> pygame.Rect:
-        """Store background coordonates"""
-        return pygame.Rect(0, 0, config.WIDTH, config.HEIGHT)
+        self.image = _load_bg()
+        self._dest = (0, 0)
 
-    def draw(self, screen) -> None:
+    def draw(self, screen: pygame.Surface) -> None:
         """Draw the background of the game"""
-        screen.blit(self.image, self.rect)
+        screen.blit(self.image, self._dest)